@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Flash stage baudrate picked from the link errors: the step down once too
+many frames of the window failed, and the step back up after a run of
+clean frames.
+
+    python3 tests/test_baudrate_governor.py
+'''
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kflash import BaudrateGovernor, ISP_BAUD_WINDOW, ISP_BAUD_DOWNSHIFT_RATE, ISP_BAUD_UPSHIFT_FRAMES
+
+# Failures in a window that still keep the rate
+TOLERATED = int(ISP_BAUD_DOWNSHIFT_RATE * ISP_BAUD_WINDOW)
+
+
+class BaudrateGovernorTest(unittest.TestCase):
+    def test_steps_down_on_errors(self):
+        governor = BaudrateGovernor(1500000)
+        for n in range(ISP_BAUD_WINDOW - TOLERATED):
+            self.assertIsNone(governor.record(True, 1500000))
+        for n in range(TOLERATED):
+            self.assertIsNone(governor.record(False, 1500000))
+        self.assertEqual(governor.record(False, 1500000), (921600, '%d of the last %d frames failed' % (TOLERATED + 1, ISP_BAUD_WINDOW)))
+
+    def test_old_errors_leave_the_window(self):
+        governor = BaudrateGovernor(1500000)
+        for n in range(TOLERATED):
+            governor.record(False, 1500000)
+        for n in range(ISP_BAUD_WINDOW):
+            governor.record(True, 1500000)
+        self.assertIsNone(governor.record(False, 1500000))
+
+    def test_change_clears_the_window(self):
+        governor = BaudrateGovernor(3000000)
+        for n in range(TOLERATED + 1):
+            change = governor.record(False, 3000000)
+        self.assertEqual(change[0], 2000000)
+        governor.changed(3000000, 2000000, change[1])
+        self.assertIsNone(governor.record(False, 2000000))
+        self.assertEqual([(old, new) for seconds, old, new, reason in governor.changes], [(3000000, 2000000)])
+
+    def test_lowest_rate_and_disabled(self):
+        governor = BaudrateGovernor(115200)
+        for n in range(ISP_BAUD_WINDOW):
+            self.assertIsNone(governor.record(False, 115200))
+        governor = BaudrateGovernor(1500000, enabled=False)
+        for n in range(ISP_BAUD_WINDOW):
+            self.assertIsNone(governor.record(False, 1500000))
+
+    def test_steps_up_after_clean_frames(self):
+        governor = BaudrateGovernor(3000000, upshift=True)
+        for n in range(ISP_BAUD_UPSHIFT_FRAMES - 1):
+            self.assertIsNone(governor.record(True, 921600))
+        self.assertEqual(governor.record(True, 921600), (1500000, '%d clean frames' % ISP_BAUD_UPSHIFT_FRAMES))
+        # Never above the requested rate
+        governor = BaudrateGovernor(1000000, upshift=True)
+        for n in range(ISP_BAUD_UPSHIFT_FRAMES):
+            change = governor.record(True, 921600)
+        self.assertEqual(change[0], 1000000)
+        self.assertIsNone(BaudrateGovernor(921600, upshift=True).record(True, 921600))
+
+    def test_failed_rate_needs_more_clean_frames(self):
+        governor = BaudrateGovernor(1500000, upshift=True)
+        for n in range(TOLERATED + 1):
+            change = governor.record(False, 1500000)
+        governor.changed(1500000, change[0], change[1])
+        for n in range(2 * ISP_BAUD_UPSHIFT_FRAMES - 1):
+            self.assertIsNone(governor.record(True, 921600))
+        self.assertEqual(governor.record(True, 921600)[0], 1500000)
+
+    def test_no_upshift_by_default(self):
+        governor = BaudrateGovernor(3000000)
+        for n in range(4 * ISP_BAUD_UPSHIFT_FRAMES):
+            self.assertIsNone(governor.record(True, 921600))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Size of the flash write frames: fixed sizes as given, and the auto mode
+that trades the ack turnaround against the cost of a checksum failure.
+
+    python3 tests/test_frame_size.py
+'''
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kflash import FrameSizeTuner, ISP_FLASH_SECTOR_SIZE, ISP_FLASH_DATA_FRAME_SIZE
+
+
+class FrameSizeTunerTest(unittest.TestCase):
+    def test_fixed_size(self):
+        self.assertEqual(FrameSizeTuner(None, 1500000).size, ISP_FLASH_DATA_FRAME_SIZE)
+        tuner = FrameSizeTuner(16384, 1500000)
+        tuner.update(16384, 5.0, 3)
+        self.assertEqual(tuner.size, 16384)
+        self.assertEqual((tuner.frames, tuner.retries), (1, 3))
+        # The last frame is padded to a full frame
+        self.assertEqual(tuner.pad(b'\x01' * 100), b'\x01' * 100 + b'\x00' * 16284)
+
+    def test_auto_keeps_large_frames_on_a_clean_link(self):
+        tuner = FrameSizeTuner("auto", 115200)
+        self.assertEqual(tuner.size, ISP_FLASH_DATA_FRAME_SIZE)
+        for n in range(10):
+            frame_time = tuner.size * tuner.byte_time
+            tuner.update(tuner.size, frame_time + 0.05, 0)
+        self.assertAlmostEqual(tuner.turnaround, 0.05)
+        self.assertEqual(tuner.size, ISP_FLASH_DATA_FRAME_SIZE)
+
+    def test_auto_shrinks_frames_on_a_noisy_link(self):
+        tuner = FrameSizeTuner("auto", 115200)
+        for n in range(10):
+            frame_time = tuner.size * tuner.byte_time
+            tuner.update(tuner.size, 2 * (frame_time + 0.01), 1)
+        self.assertGreater(tuner.byte_error_rate, 0)
+        self.assertLess(tuner.size, ISP_FLASH_DATA_FRAME_SIZE)
+        self.assertGreaterEqual(tuner.size, ISP_FLASH_SECTOR_SIZE)
+        self.assertEqual(tuner.size % ISP_FLASH_SECTOR_SIZE, 0)
+
+    def test_auto_pads_to_the_sector(self):
+        tuner = FrameSizeTuner("auto", 1500000)
+        self.assertEqual(len(tuner.pad(b'\x01' * 100)), ISP_FLASH_SECTOR_SIZE)
+        self.assertEqual(len(tuner.pad(b'\x01' * (ISP_FLASH_SECTOR_SIZE + 1))), 2 * ISP_FLASH_SECTOR_SIZE)
+        self.assertEqual(len(tuner.pad(b'\x01' * ISP_FLASH_SECTOR_SIZE)), ISP_FLASH_SECTOR_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Eviction of the prepared image cache shared by the `kflash serve` workers.
+
+    python3 tests/test_image_cache.py
+'''
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kflash import ImageCache
+
+
+class ImageCacheTest(unittest.TestCase):
+    def test_keeps_size_entries(self):
+        for size in (1, 2, 3):
+            cache = ImageCache(size)
+            for key in range(5):
+                cache.put(key, [key])
+            self.assertEqual([key for key, images in cache.entries], list(range(5 - size, 5)))
+            self.assertEqual(cache.get(4), [4])
+            self.assertIsNone(cache.get(0))
+
+    def test_get_refreshes_entry(self):
+        cache = ImageCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+    def test_put_replaces_same_key(self):
+        cache = ImageCache(2)
+        cache.put('a', 1)
+        cache.put('a', 2)
+        self.assertEqual(cache.entries, [('a', 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
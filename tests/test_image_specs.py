@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Checks of the FILE@ADDRESS images given on the command line, before any
+port is opened: the spec syntax, raw binaries only, sector alignment and
+no overlap of the framed images.
+
+    python3 tests/test_image_specs.py
+'''
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kflash import KFlash
+
+# Nothing listens there, images that pass the checks fail to open the port
+PORT = 'socket://127.0.0.1:1'
+
+
+class ImageSpecsTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.image = os.path.join(self.dir, 'a.bin')
+        with open(self.image, 'wb') as f:
+            f.write(b'\x01' * 5000)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def error(self, *specs):
+        kflash = KFlash(print_callback=lambda *args, **kwargs: None)
+        with self.assertRaises(Exception) as raised:
+            kflash.process(terminal=False, dev=PORT, file=list(specs), noansi=True)
+        return str(raised.exception)
+
+    def test_syntax(self):
+        self.assertIn('FILE@ADDRESS', self.error(self.image + '@0x1000:hash'))
+        self.assertIn('FILE@ADDRESS', self.error(self.image + '@zero'))
+        self.assertIn('FILE@ADDRESS', self.error('@0x1000', self.image + '@0'))
+
+    def test_alignment(self):
+        self.assertIn('sector boundary: 0x00001001', self.error(self.image + '@0x1001'))
+
+    def test_overlap(self):
+        # 5000 bytes and the 37 byte hash frame end at 0x23ad
+        text = self.error(self.image + '@0x2000', self.image + '@0x1000')
+        self.assertIn('at 0x00002000 overlaps', text)
+        self.assertIn('ends at 0x000023ad', text)
+        # Two sectors end at the next sector only without the hash frame
+        sectors = os.path.join(self.dir, 'b.bin')
+        with open(sectors, 'wb') as f:
+            f.write(b'\x02' * 8192)
+        self.assertIn('overlaps', self.error(sectors + '@0x1000', self.image + '@0x3000'))
+        self.assertIn('Could not open port', self.error(sectors + '@0x1000:nohash', self.image + '@0x3000'))
+
+    def test_only_bin_files(self):
+        package = os.path.join(self.dir, 'fw.kfpkg')
+        with open(package, 'wb') as f:
+            f.write(b'PK\x03\x04' + b'\x00' * 100)
+        self.assertIn('Only bin files', self.error(package + '@0'))
+
+    def test_valid_images_reach_the_port(self):
+        self.assertIn('Could not open port', self.error(self.image + '@0x1000', self.image + '@0x3000'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Start-up work of kflash, as seen by `python -X importtime`. Importing the
+module and `kflash --version` must not load pyserial or the modules only a
+flash, a package or an encrypted image needs, and must leave the embedded
+flash stub compressed.
+
+    python3 tests/test_import_time.py
+'''
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KFLASH = os.path.join(ROOT, 'kflash.py')
+
+# Loaded only on the paths that use them
+LAZY = ('serial', 'elftools', 'json', 'zipfile', 'tempfile', 'hashlib', 'zlib', 'copy', 'mmap', 'socket')
+
+
+def imported(*argv):
+    '''Names of the modules the interpreter imports running argv, from -X importtime.'''
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + list(argv), cwd=ROOT,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode:
+        raise AssertionError(result.stderr.decode('utf-8', 'replace'))
+    modules = set()
+    for line in result.stderr.decode('utf-8', 'replace').splitlines():
+        if line.startswith('import time:') and line.count('|') == 2:
+            modules.add(line.rsplit('|', 1)[1].strip())
+    return modules
+
+
+class ImportTimeTest(unittest.TestCase):
+    def assertLazy(self, modules, lazy):
+        self.assertIn('kflash', modules)
+        self.assertEqual(sorted(name for name in modules if name.split('.')[0] in lazy), [])
+
+    def test_import(self):
+        self.assertLazy(imported('-c', 'import kflash'), LAZY + ('argparse', 're', 'enum'))
+
+    def test_version(self):
+        # argparse loads shutil, which loads zlib
+        lazy = tuple(name for name in LAZY if name != 'zlib')
+        self.assertLazy(imported('-c', 'import sys, kflash; sys.argv = ["kflash", "--version"]; kflash.main()'), lazy)
+
+    def test_stub_stays_compressed(self):
+        code = 'import kflash; print(kflash._isp_prog is None)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+        self.assertEqual(output.strip(), b'True')
+
+
+if __name__ == '__main__':
+    unittest.main()
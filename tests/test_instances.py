@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Several KFlash instances flashing side by side in one process, each one
+against its own TCP stand-in board from tools/k210_standin.py. Every
+instance must see only its own log lines, and the callback dispatcher
+threads must be gone once the runs are over.
+
+    python3 tests/test_instances.py
+'''
+import argparse
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+
+from kflash import KFlash
+import k210_standin
+
+
+def start_standin(**options):
+    '''Serve a stand-in board on a free local port, return the port.'''
+    settings = dict(latency=0.0, error=0.0, drop=0.0, wire=False, cold=False)
+    settings.update(options)
+    standin = k210_standin.StandIn(argparse.Namespace(**settings))
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    def accept():
+        while True:
+            conn, _ = server.accept()
+            thread = threading.Thread(target=standin.serve, args=(conn,))
+            thread.daemon = True
+            thread.start()
+    thread = threading.Thread(target=accept)
+    thread.daemon = True
+    thread.start()
+    return server.getsockname()[1]
+
+
+class InstancesTest(unittest.TestCase):
+    def setUp(self):
+        # The flash journal goes to ~/.kflash, keep it out of the real one
+        self.home = os.environ.get('HOME')
+        os.environ['HOME'] = tempfile.mkdtemp()
+        self.images = []
+        for size in (20000, 70000, 150000):
+            with tempfile.NamedTemporaryFile(suffix='.bin', delete=False) as f:
+                f.write(os.urandom(size))
+            self.images.append(f.name)
+
+    def tearDown(self):
+        for path in self.images:
+            os.remove(path)
+        shutil.rmtree(os.environ['HOME'])
+        if self.home is None:
+            del os.environ['HOME']
+        else:
+            os.environ['HOME'] = self.home
+
+    def test_concurrent_instances(self):
+        ports = [start_standin(latency=0.002 * n) for n in range(len(self.images))]
+        logs = dict((port, []) for port in ports)
+        errors = {}
+        dispatchers = []
+
+        def run(port, image, baudrate):
+            def callback(*args, **kwargs):
+                logs[port].append(' '.join(str(arg) for arg in args))
+            kflash = KFlash(print_callback=callback)
+            dispatchers.append(kflash.dispatcher)
+            try:
+                kflash.process(terminal=False, dev='socket://127.0.0.1:%d' % port, file=image,
+                               baudrate=baudrate, noansi=True)
+            except Exception as e:
+                errors[port] = str(e)
+
+        threads = [threading.Thread(target=run, args=(port, image, baudrate))
+                   for port, image, baudrate in zip(ports, self.images, (115200, 1500000, 3000000))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(120)
+
+        self.assertEqual(errors, {})
+        for port in ports:
+            text = '\n'.join(logs[port])
+            self.assertIn('socket://127.0.0.1:%d' % port, text)
+            self.assertIn('Rebooting', text)
+            for other in ports:
+                if other != port:
+                    self.assertNotIn('127.0.0.1:%d' % other, text)
+
+        # The dispatcher threads end once they have been idle for a while
+        deadline = time.time() + 5
+        while any(d.thread is not None for d in dispatchers) and time.time() < deadline:
+            time.sleep(0.1)
+        self.assertEqual([d.thread for d in dispatchers], [None] * len(dispatchers))
+
+
+if __name__ == '__main__':
+    unittest.main()
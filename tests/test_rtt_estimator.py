@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Adaptive receive timeout of a stage: the RFC 6298 smoothing, the clamp to
+ISP_RTO_MIN and ISP_RTO_MAX, the backoff on timeouts and the wait for a
+late ack.
+
+    python3 tests/test_rtt_estimator.py
+'''
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kflash import RttEstimator, ISP_RTO_MIN, ISP_RTO_MAX, ISP_RTO_DRAIN_K
+
+
+class RttEstimatorTest(unittest.TestCase):
+    def test_fallback_until_first_sample(self):
+        rtt = RttEstimator()
+        self.assertEqual(rtt.rto, ISP_RTO_MAX)
+        self.assertEqual(rtt.timeout(0.25, 4096, 0.5), 0.75)
+        self.assertEqual(rtt.drain(0.25, 4096, 0.5), 0.75)
+
+    def test_first_sample(self):
+        rtt = RttEstimator()
+        rtt.sample(0.1, 4096)
+        self.assertAlmostEqual(rtt.srtt, 0.1)
+        self.assertAlmostEqual(rtt.rttvar, 0.05)
+        self.assertAlmostEqual(rtt.rto, 0.3)
+        self.assertAlmostEqual(rtt.timeout(0.25, 4096, 0.5), 0.55)
+
+    def test_rto_clamp(self):
+        fast = RttEstimator()
+        for n in range(20):
+            fast.sample(0.001, 4096)
+        self.assertEqual(fast.rto, ISP_RTO_MIN)
+        slow = RttEstimator()
+        slow.sample(ISP_RTO_MAX * 2, 4096)
+        self.assertEqual(slow.rto, ISP_RTO_MAX)
+
+    def test_backoff(self):
+        rtt = RttEstimator()
+        rtt.sample(0.1, 4096)
+        expected = [0.6, 1.2, 2.4, ISP_RTO_MAX, ISP_RTO_MAX]
+        for rto in expected:
+            rtt.timed_out()
+            self.assertAlmostEqual(rtt.rto, rto)
+        self.assertEqual(rtt.timeouts, len(expected))
+        # The next sample measures the link again
+        rtt.sample(0.1, 4096)
+        self.assertLess(rtt.rto, 0.6)
+
+    def test_larger_request_waits_longer(self):
+        rtt = RttEstimator()
+        rtt.sample(0.1, 4096)
+        self.assertAlmostEqual(rtt.timeout(0.0, 8192, 0.5), 2 * rtt.rto)
+        self.assertAlmostEqual(rtt.timeout(0.0, 1024, 0.5), rtt.rto)
+
+    def test_drain(self):
+        rtt = RttEstimator()
+        for turnaround in (0.1, 0.2, 0.1, 0.2):
+            rtt.sample(turnaround, 4096)
+        late = rtt.srtt + ISP_RTO_DRAIN_K * rtt.rttvar
+        self.assertGreater(late, rtt.rto)
+        self.assertAlmostEqual(rtt.drain(0.25, 4096, 0.5), 0.25 + late)
+        # Never shorter than the backed off rto, never longer than ISP_RTO_MAX
+        for n in range(3):
+            rtt.timed_out()
+        self.assertAlmostEqual(rtt.drain(0.25, 4096, 0.5), 0.25 + max(rtt.rto, late))
+        self.assertAlmostEqual(rtt.drain(0.25, 4096 * 16, 0.5), 0.25 + ISP_RTO_MAX)
+
+
+if __name__ == '__main__':
+    unittest.main()
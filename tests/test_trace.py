@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Wire traces of dry runs, for bin files and the packed images made of them.
+The flash frames of every way to give the same images must be the ones
+the baseline kflash sent. fixtures/baseline_flash_frames.json holds the
+unescaped header (op, checksum over the payload, address, length) and the
+escaped size of each 0xd4 frame, as recorded from the baseline release
+flashing the images built in FrameStreamTest.setUp.
+
+    python3 tests/test_trace.py
+'''
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from kflash import WireTrace
+
+KFLASH = os.path.join(ROOT, 'kflash.py')
+
+
+def kflash(*argv):
+    '''Run the kflash command line, fail with its output if it fails.'''
+    result = subprocess.run([sys.executable, KFLASH] + list(argv), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if result.returncode:
+        raise AssertionError(result.stdout.decode('utf-8', 'replace'))
+    return result.stdout.decode('utf-8', 'replace')
+
+
+def flash_writes(path):
+    '''(unescaped header, bytes on the wire) of every 0xd4 frame in a trace.'''
+    return [(data, wire) for seconds, direction, op, reason, wire, data in WireTrace.read(path)
+            if direction == WireTrace.HOST and op == 0xd4]
+
+
+class TraceTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.image = os.path.join(self.dir, 'fw.bin')
+        with open(self.image, 'wb') as f:
+            # Every byte value, SLIP delimiters and escapes included
+            f.write(bytes(range(256)) * 600)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_packed_image_is_traced(self):
+        kflash('pack', '-o', self.path('fw.kfwp'), self.image)
+        kflash('--dry-run', '--trace', self.path('packed.kftr'), self.path('fw.kfwp'))
+        writes = flash_writes(self.path('packed.kftr'))
+        self.assertEqual(len(writes), 3)
+        for n, (header, wire) in enumerate(writes):
+            self.assertEqual(len(header), 16)
+            op, reserved, checksum, address, length = struct.unpack('<HHIII', header)
+            self.assertEqual((op, address, length), (0xd4, n * 65536, 65536))
+            self.assertGreater(wire, length)
+
+
+class FrameStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(ROOT, 'tests', 'fixtures', 'baseline_flash_frames.json')) as f:
+            self.baseline = dict((name, [(bytes.fromhex(header), wire) for header, wire in frames])
+                                 for name, frames in json.load(f).items())
+        first = bytes(range(255, -1, -1)) * 100
+        second = b'\xc0\xdb' * 9000
+        with open(self.path('fw.bin'), 'wb') as f:
+            f.write(bytes(range(256)) * 600)
+        with open(self.path('a.bin'), 'wb') as f:
+            f.write(first)
+        with open(self.path('b.bin'), 'wb') as f:
+            f.write(second)
+        files = [dict(address=0, bin='a.bin', sha256Prefix=True), dict(address=0x10000, bin='b.bin', sha256Prefix=False)]
+        with zipfile.ZipFile(self.path('fw.kfpkg'), 'w') as zf:
+            zf.writestr('flash-list.json', json.dumps(dict(version='0.1.0', files=files), indent=4))
+            zf.writestr('a.bin', first)
+            zf.writestr('b.bin', second)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def frames(self, *argv):
+        trace = self.path('run.kftr')
+        kflash('--dry-run', '--trace', trace, *argv)
+        return flash_writes(trace)
+
+    def test_bin(self):
+        self.assertEqual(self.frames(self.path('fw.bin')), self.baseline['bin'])
+        kflash('pack', '-o', self.path('fw.kfwp'), self.path('fw.bin'))
+        self.assertEqual(self.frames(self.path('fw.kfwp')), self.baseline['bin'])
+
+    def test_kfpkg(self):
+        self.assertEqual(self.frames(self.path('fw.kfpkg')), self.baseline['kfpkg'])
+        kflash('pack', '-o', self.path('fw.kfwp'), self.path('fw.kfpkg'))
+        self.assertEqual(self.frames(self.path('fw.kfwp')), self.baseline['kfpkg'])
+
+    def test_images(self):
+        images = (self.path('a.bin') + '@0', self.path('b.bin') + '@0x10000:nohash')
+        self.assertEqual(self.frames(*images), self.baseline['kfpkg'])
+        kflash('pack', '-o', self.path('fw.kfwp'), *images)
+        self.assertEqual(self.frames(self.path('fw.kfwp')), self.baseline['kfpkg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
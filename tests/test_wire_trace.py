@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Records of a wire trace read back from the file, and the matching of the
+device replies to the host frames they answer.
+
+    python3 tests/test_wire_trace.py
+'''
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kflash import WireTrace
+
+
+def frame(op, address):
+    return struct.pack('<HHIII', op, 0, 0, address, 4096) + b'\x00' * 4096
+
+
+class WireTraceTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'run.kftr')
+        self.trace = WireTrace(self.path)
+
+    def tearDown(self):
+        self.trace.close()
+        shutil.rmtree(self.dir)
+
+    def replies(self):
+        self.trace.close()
+        return WireTrace.replies(list(WireTrace.read(self.path)))
+
+    def test_read(self):
+        self.trace.host(frame(0xd4, 0x1000), 4200)
+        self.trace.device(b'\xd4\xe0')
+        self.trace.event('timeout 0.500 s')
+        self.trace.close()
+        records = list(WireTrace.read(self.path))
+        self.assertEqual([record[1:] for record in records], [
+            (WireTrace.HOST, 0xd4, 0, 4200, frame(0xd4, 0x1000)[:16]),
+            (WireTrace.DEVICE, 0xd4, 0xe0, 4, b'\xd4\xe0'),
+            (WireTrace.EVENT, 0, 0, 0, b'timeout 0.500 s'),
+        ])
+        self.assertEqual(sorted(records), records)
+
+    def test_not_a_trace(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'KFWP' + b'\x00' * 20)
+        with self.assertRaises(ValueError):
+            list(WireTrace.read(self.path))
+
+    def test_frames_in_flight_are_answered_in_order(self):
+        for n in range(3):
+            self.trace.host(frame(0xd4, n * 4096), 4200)
+        for n in range(3):
+            self.trace.device(b'\xd4\xe0')
+        self.assertEqual(self.replies(), {0: [3], 1: [4], 2: [5]})
+
+    def test_reply_skips_frames_of_other_ops(self):
+        self.trace.host(frame(0xd2, 0), 20)
+        self.trace.host(frame(0xd4, 0), 4200)
+        self.trace.device(b'\xd4\xe0')
+        self.trace.device(b'\xd2\xe0')
+        # The NOP was given up on once the write behind it was answered
+        self.assertEqual(self.replies(), {0: [], 1: [2]})
+
+    def test_timeout_gives_up_on_the_oldest_frame(self):
+        self.trace.host(frame(0xd4, 0), 4200)
+        self.trace.event('timeout 0.500 s')
+        self.trace.host(frame(0xd4, 0), 4200)
+        self.trace.device(b'\xd4\xe0')
+        self.assertEqual(self.replies(), {0: [], 2: [3]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+Flash throughput over a simulated link, per error rate and frame size:
+
+    python3 tools/bench_link.py --size 1048576 --latency 0.005 --error 0,0.02,0.05,0.1
+
+Every run flashes the same random image with kflash against a stand-in
+board from k210_standin.py with --wire, so each frame takes its line time
+at the baudrate kflash set. A row gives the wall time of the run, the
+throughput of the flash writes and the frames sent, both from the wire
+trace, the ack turnaround (write of a frame to its reply, median and 90th
+percentile), the CPU time of the kflash process per flash frame, and the
+writes the stand-in rejected and dropped. --kflash runs another kflash.py
+with the same options, to compare a change with the tree before it.
+'''
+import argparse
+import os
+import random
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from kflash import WireTrace
+
+STANDIN = os.path.join(ROOT, 'tools', 'k210_standin.py')
+
+
+def free_port():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    port = server.getsockname()[1]
+    server.close()
+    return port
+
+
+def percentile(values, share):
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def run(args, image, trace, error, frame_size):
+    '''
+    Flash image once, return (seconds, flash seconds, frames, turnarounds,
+    cpu seconds, stand-in summary).
+    '''
+    listen = '127.0.0.1:%d' % free_port()
+    standin = subprocess.Popen([sys.executable, STANDIN, '-l', listen, '--latency', str(args.latency), '--error', str(error),
+                                '--drop', str(args.drop), '--wire', '--seed', str(args.seed)],
+                               stdout=subprocess.PIPE, universal_newlines=True)
+    try:
+        standin.stdout.readline()
+        argv = [sys.executable, args.kflash, '-p', 'socket://' + listen, '-b', str(args.baudrate),
+                '--frame-size', frame_size, '--trace', trace, image]
+        # The stand-in is not waited for yet, the children times are the ones of kflash
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        start = time.time()
+        result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        seconds = time.time() - start
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        if result.returncode:
+            raise RuntimeError(result.stdout.decode('utf-8', 'replace')[-2000:])
+        summary = standin.stdout.readline().strip()
+    finally:
+        standin.terminate()
+        standin.wait()
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+
+    records = list(WireTrace.read(trace))
+    frames, turnarounds, first, last = 0, [], None, None
+    for host, replies in sorted(WireTrace.replies(records).items()):
+        if records[host][2] != 0xd4:
+            continue
+        frames += 1
+        first = records[host][0] if first is None else first
+        if replies:
+            turnarounds.append(records[replies[0]][0] - records[host][0])
+            last = records[replies[0]][0]
+    return seconds, (last or 0) - (first or 0), frames, turnarounds, cpu, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench_link", description="Flash throughput against a simulated link")
+    parser.add_argument("--kflash", help="kflash.py to run", default=os.path.join(ROOT, 'kflash.py'))
+    parser.add_argument("--size", help="Image size in bytes", type=int, default=1024 * 1024)
+    parser.add_argument("-b", "--baudrate", help="Flash baudrate", type=int, default=1500000)
+    parser.add_argument("--latency", help="Seconds before each reply", type=float, default=0.005)
+    parser.add_argument("--error", help="Comma separated shares of flash writes rejected with a checksum error", default="0,0.02,0.05,0.1")
+    parser.add_argument("--drop", help="Share of flash writes left unanswered", type=float, default=0.0)
+    parser.add_argument("--frame-size", dest="frame_size", help="Comma separated frame sizes, 'auto' for the tuner", default="4096,16384,65536,auto")
+    parser.add_argument("--seed", help="Seed of the error and drop draws and of the image", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp()
+    # The flash journal goes to ~/.kflash
+    env_home = os.environ.get('HOME')
+    os.environ['HOME'] = workdir
+    try:
+        image = os.path.join(workdir, 'image.bin')
+        with open(image, 'wb') as f:
+            f.write(random.Random(args.seed).getrandbits(8 * args.size).to_bytes(args.size, 'little'))
+        trace = os.path.join(workdir, 'run.kftr')
+
+        print("%d bytes at %d baud, latency %.3f s, drop %.2f" % (args.size, args.baudrate, args.latency, args.drop))
+        print("%6s %6s %8s %9s %7s %11s %11s %13s  %s" % ('error', 'frame', 'seconds', 'kiB/s', 'frames', 'ack p50 ms', 'ack p90 ms', 'cpu ms/frame', 'stand-in'))
+        for error in args.error.split(','):
+            for frame_size in args.frame_size.split(','):
+                seconds, flash_seconds, frames, turnarounds, cpu, summary = run(args, image, trace, error, frame_size)
+                print("%6s %6s %8.2f %9.1f %7d %11.2f %11.2f %13.2f  %s" % (
+                    error, frame_size, seconds, args.size / 1024.0 / max(flash_seconds, 1e-6), frames,
+                    percentile(turnarounds, 0.5) * 1000, percentile(turnarounds, 0.9) * 1000,
+                    cpu * 1000 / max(frames, 1), summary.split(', ', 1)[-1]))
+                sys.stdout.flush()
+    finally:
+        if env_home is None:
+            del os.environ['HOME']
+        else:
+            os.environ['HOME'] = env_home
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
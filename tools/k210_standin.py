@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+'''
+TCP stand-in for a K210 board, to run kflash against without hardware:
+
+    python3 tools/k210_standin.py --listen 127.0.0.1:3001 --latency 0.02 --drop 0.1 &
+    kflash -p socket://127.0.0.1:3001 -b 1500000 firmware.bin
+
+It speaks the device side of the SLIP framed protocol: it answers the ISP
+greeting and memory writes, and after the boot command the NOP, flash init
+and flash write requests of the flash stub, checking the CRC of every write.
+Replies go out on their own threads after --latency seconds, so several
+frames can be in flight as on a network serial server. --error makes the
+stub reject a share of the flash writes and --drop leaves a share of them
+unanswered, which exercises the retry and go-back-N paths. --wire adds the
+line time of each frame at the baudrate kflash set, --cold only answers
+the flash stub NOP after a boot, like a board that was reset.
+'''
+import argparse
+import binascii
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+
+# Requests that are answered, ISP: greeting and memory write; stub: NOP,
+# flash write and flash init. The boot and baudrate requests have no reply.
+ANSWERED = (0xc2, 0xc3, 0xd2, 0xd4, 0xd7)
+RET_OK = 0xe0
+RET_BAD_DATA_CHECKSUM = 0xe2
+
+
+class StandIn:
+    def __init__(self, args):
+        self.args = args
+        self.lock = threading.Lock()
+        self.stats = dict(frames=0, flash_writes=0, rejected=0, dropped=0)
+
+    def count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def serve(self, conn):
+        args = self.args
+        send_lock = threading.Lock()
+        baudrate = [115200]
+        booted = [False]
+
+        def reply(op, reason, delay):
+            time.sleep(delay)
+            with send_lock:
+                try:
+                    conn.sendall(bytes([0xc0, op, reason, 0xc0]))
+                except (IOError, OSError):
+                    pass
+
+        buf = b''
+        while True:
+            data = conn.recv(65536)
+            if not data:
+                break
+            buf += data
+            while True:
+                start = buf.find(b'\xc0')
+                if start < 0:
+                    buf = b''
+                    break
+                end = buf.find(b'\xc0', start + 1)
+                if end < 0:
+                    buf = buf[start:]
+                    break
+                raw, buf = buf[start + 1:end], buf[end + 1:]
+                if not raw:
+                    # Two delimiters in a row, the second one opens the next frame
+                    buf = b'\xc0' + buf
+                    continue
+                packet = raw.replace(b'\xdb\xdc', b'\xc0').replace(b'\xdb\xdd', b'\xdb')
+                op, reason = packet[0], RET_OK
+                self.count('frames')
+                if op == 0xc5:
+                    booted[0] = True
+                elif op == 0xd6 and len(packet) >= 20:
+                    baudrate[0] = struct.unpack('<III', packet[8:20])[2]
+                if op in (0xc3, 0xd4):
+                    checksum = struct.unpack('<I', packet[4:8])[0]
+                    if binascii.crc32(packet[8:]) & 0xffffffff != checksum:
+                        reason = RET_BAD_DATA_CHECKSUM
+                if op == 0xd4:
+                    self.count('flash_writes')
+                    if random.random() < args.error:
+                        reason = RET_BAD_DATA_CHECKSUM
+                    if random.random() < args.drop:
+                        self.count('dropped')
+                        continue
+                if op == 0xd2 and args.cold and not booted[0]:
+                    continue
+                if reason != RET_OK:
+                    self.count('rejected')
+                if op in ANSWERED:
+                    delay = args.latency
+                    if args.wire:
+                        delay += (len(raw) + 2) * 10.0 / baudrate[0]
+                    thread = threading.Thread(target=reply, args=(op, reason, delay))
+                    thread.daemon = True
+                    thread.start()
+        conn.close()
+        with self.lock:
+            print("connection closed,", ", ".join("%s %d" % item for item in sorted(self.stats.items())))
+            sys.stdout.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="k210_standin", description="TCP stand-in for a K210 board, use with kflash -p socket://HOST:PORT")
+    parser.add_argument("-l", "--listen", help="host:port to listen on", default="127.0.0.1:3001")
+    parser.add_argument("--latency", help="Seconds before each reply", type=float, default=0.0)
+    parser.add_argument("--error", help="Share of flash writes rejected with a checksum error", type=float, default=0.0)
+    parser.add_argument("--drop", help="Share of flash writes left unanswered", type=float, default=0.0)
+    parser.add_argument("--wire", help="Add the line time of each frame at the current baudrate", default=False, action="store_true")
+    parser.add_argument("--cold", help="Answer the flash stub NOP only after a boot", default=False, action="store_true")
+    parser.add_argument("--seed", help="Seed of the error and drop draws", type=int, default=None)
+    args = parser.parse_args(argv)
+    random.seed(args.seed)
+
+    host, port = args.listen.rsplit(":", 1)
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind((host, int(port)))
+    server.listen(5)
+    print("K210 stand-in on %s, use kflash -p socket://%s" % (args.listen, args.listen))
+    sys.stdout.flush()
+    standin = StandIn(args)
+    try:
+        while True:
+            conn, _ = server.accept()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            thread = threading.Thread(target=standin.serve, args=(conn,))
+            thread.daemon = True
+            thread.start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()